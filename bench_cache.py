@@ -0,0 +1,108 @@
+"""On-disk cache of successful benchmark outcomes, for --cache/--force."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("bench")
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "warptest" / "results.json"
+
+
+def runtime_fingerprint(server_path: Path, cli_host_path: Path, node: Optional[str]) -> str:
+    """
+    Short hash of what runs the scripts besides the scripts themselves: the Node server path
+    and the contents of both Node host scripts, plus the version of `node` (the resolved
+    executable, or None when missing) and of the embedded engines.
+    """
+    hasher = hashlib.blake2b(str(server_path.resolve()).encode("utf-8"), digest_size=8)
+    for host in (server_path, cli_host_path):
+        try:
+            hasher.update(host.read_bytes())
+        except OSError:
+            hasher.update(b"-")
+    versions: List[str] = []
+    if node is not None:
+        try:
+            proc = subprocess.run(
+                [node, "--version"], capture_output=True, text=True, timeout=5, check=False
+            )
+            versions.append(f"node={proc.stdout.strip()}")
+        except Exception:  # noqa: BLE001
+            versions.append("node=?")
+    # Imported here: importlib.metadata is slow to import and only --cache needs it.
+    from importlib import metadata
+
+    for dist in ("py-mini-racer", "mini-racer", "jsrun", "js2py"):
+        try:
+            versions.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            pass
+    hasher.update("\0".join(versions).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ResultsCache:
+    """
+    Outcome entries (EngineOutcome.to_json dicts) from earlier runs, stored as one JSON file.
+
+    Keys combine a hash of the code the engines actually run (peer bundle included), the
+    engine name, the measurement flags and `environment` (see runtime_fingerprint), so a
+    script edit, flag change, Node host edit or engine upgrade misses the cache. Changes to
+    the machine itself (CPU, load, OS) are not noticed.
+
+    The file is read once and written once per script, so it uses the stdlib json module:
+    exact big integers and NaN in payloads round-trip unchanged.
+    """
+
+    def __init__(self, path: Path, environment: str = "") -> None:
+        self.path = path
+        self.environment = environment
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.dirty = False
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable results cache %s: %s", self.path, exc)
+            return
+        if isinstance(data, dict):
+            self.entries = data
+
+    def key(self, code: str, engine: str, args: argparse.Namespace) -> str:
+        digest = hashlib.blake2b(code.encode("utf-8"), digest_size=8).hexdigest()
+        return (
+            f"{digest}:{self.environment}:{engine}:i{args.iterations}:w{args.warmup}"
+            f":spawn{int(args.node_cli_spawn)}:perf{int(args.perf)}:conc{int(args.concurrent)}"
+            f":t{args.max_time:g}"
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, object]]:
+        entry = self.entries.get(key)
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, key: str, entry: Dict[str, object]) -> None:
+        self.entries[key] = entry
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so an interrupted save never leaves a truncated cache behind.
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
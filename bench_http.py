@@ -0,0 +1,105 @@
+"""Minimal keep-alive HTTP/1.1 client used by the node-http engines (see node_server.js)."""
+from __future__ import annotations
+
+import socket
+from typing import BinaryIO, List, Optional, Tuple
+
+
+def http_post_frame(port: int, path: str, body: bytes) -> bytes:
+    """Build a complete keep-alive HTTP/1.1 POST request (headers + JSON body) once."""
+    head = (
+        f"POST {path} HTTP/1.1\r\n"
+        f"Host: 127.0.0.1:{port}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: keep-alive\r\n"
+        "\r\n"
+    )
+    return head.encode("ascii") + body
+
+
+class RawHttpConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client for the local Node server.
+
+    Each exchange is one `sendall` of a prebuilt frame plus a sized read of the reply, which
+    skips the per-request object and header handling of urllib/http.client.
+    """
+
+    def __init__(self, port: int, timeout: Optional[float] = 10) -> None:
+        self.port = port
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.reader: Optional[BinaryIO] = None
+
+    def _connect(self) -> None:
+        self.sock = socket.create_connection(("127.0.0.1", self.port), timeout=self.timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+
+    def close(self) -> None:
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def exchange(self, frame: bytes) -> Tuple[int, bytes]:
+        """Send `frame` and return (status, body), reconnecting once if the socket went stale."""
+        if self.sock is None:
+            self._connect()
+        try:
+            return self._exchange(frame)
+        except ConnectionError:
+            # The server dropped the idle socket (keep-alive timeout); reconnect once.
+            self.close()
+            self._connect()
+            return self._exchange(frame)
+
+    def _exchange(self, frame: bytes) -> Tuple[int, bytes]:
+        assert self.sock is not None and self.reader is not None
+        self.sock.sendall(frame)
+        reader = self.reader
+        status_line = reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split(None, 2)[1])
+        length: Optional[int] = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = b"chunked" in value.lower()
+            elif name == b"connection":
+                keep_alive = value.strip().lower() != b"close"
+        if chunked:
+            body = self._read_chunked()
+        elif length is not None:
+            body = reader.read(length)
+        else:
+            body = reader.read()
+            keep_alive = False
+        if not keep_alive:
+            self.close()
+        return status, body
+
+    def _read_chunked(self) -> bytes:
+        assert self.reader is not None
+        parts: List[bytes] = []
+        while True:
+            size = int(self.reader.readline().split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line.
+                while self.reader.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(parts)
+            parts.append(self.reader.read(size))
+            self.reader.readline()
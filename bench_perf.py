@@ -0,0 +1,99 @@
+"""Per-thread hardware instruction/cycle counters via perf_event_open(2), for --perf."""
+from __future__ import annotations
+
+import logging
+import os
+import platform
+import sys
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("bench")
+
+# perf_event_open(2) plumbing for --perf. Only the leading fields of perf_event_attr are
+# needed; the kernel accepts the original 64-byte layout (PERF_ATTR_SIZE_VER0).
+_PERF_EVENT_OPEN_NR = {"x86_64": 298, "aarch64": 241, "i386": 336, "i686": 336}
+_PERF_TYPE_HARDWARE = 0
+_PERF_COUNT_HW_CPU_CYCLES = 0
+_PERF_COUNT_HW_INSTRUCTIONS = 1
+_PERF_EXCLUDE_KERNEL_HV = (1 << 5) | (1 << 6)  # user-space only; allowed at perf_event_paranoid=2
+_PERF_FLAG_FD_CLOEXEC = 1 << 3
+
+
+class PerfCounters:
+    """
+    Hardware instruction/cycle counters for the calling thread (Linux only).
+
+    Counting is per thread, so the numbers are only meaningful for engines whose JS runs on
+    the thread that calls `read()` (the in-process engines).
+    """
+
+    def __init__(self) -> None:
+        import ctypes
+
+        if sys.platform != "linux":
+            raise OSError("perf counters require Linux")
+        nr = _PERF_EVENT_OPEN_NR.get(platform.machine())
+        if nr is None:
+            raise OSError(f"perf_event_open syscall number unknown for {platform.machine()}")
+
+        class _PerfEventAttr(ctypes.Structure):
+            _fields_ = [
+                ("type", ctypes.c_uint32),
+                ("size", ctypes.c_uint32),
+                ("config", ctypes.c_uint64),
+                ("sample_period", ctypes.c_uint64),
+                ("sample_type", ctypes.c_uint64),
+                ("read_format", ctypes.c_uint64),
+                ("flags", ctypes.c_uint64),
+                ("wakeup_events", ctypes.c_uint32),
+                ("bp_type", ctypes.c_uint32),
+                ("config1", ctypes.c_uint64),
+            ]
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.syscall.restype = ctypes.c_long
+        self._fds: List[int] = []
+
+        def _open(config: int) -> int:
+            attr = _PerfEventAttr(
+                type=_PERF_TYPE_HARDWARE,
+                size=ctypes.sizeof(_PerfEventAttr),
+                config=config,
+                flags=_PERF_EXCLUDE_KERNEL_HV,
+            )
+            fd = libc.syscall(
+                nr, ctypes.byref(attr), 0, -1, -1, ctypes.c_ulong(_PERF_FLAG_FD_CLOEXEC)
+            )
+            if fd < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, f"perf_event_open failed: {os.strerror(err)}")
+            return fd
+
+        try:
+            self._fds.append(_open(_PERF_COUNT_HW_INSTRUCTIONS))
+            self._fds.append(_open(_PERF_COUNT_HW_CPU_CYCLES))
+        except OSError:
+            self.close()
+            raise
+
+    def read(self) -> Tuple[int, int]:
+        """Return the running (instructions, cycles) totals."""
+        instr_fd, cycles_fd = self._fds
+        return (
+            int.from_bytes(os.read(instr_fd, 8), sys.byteorder),
+            int.from_bytes(os.read(cycles_fd, 8), sys.byteorder),
+        )
+
+    def close(self) -> None:
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+
+
+def open_perf_counters() -> Optional[PerfCounters]:
+    """Open counters for the current thread, or return None (with a log line) if unavailable."""
+    try:
+        return PerfCounters()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Hardware perf counters unavailable (%s); reporting wall/CPU time only.", exc)
+        return None
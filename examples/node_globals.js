@@ -0,0 +1,102 @@
+// Uses the globals a `node -e` script can rely on (Buffer, process, timers, URL, ...), so
+// the persistent node-cli worker and `--node-cli-spawn` can be checked to agree. Engines
+// without Node globals (py-mini-racer, jsrun, js2py) report `node: false` instead.
+(() => {
+  const benchRunners = (globalThis.benchRunners = globalThis.benchRunners || {});
+
+  function makeLogger(label) {
+    const logs = [];
+    const log = (...args) => {
+      const msg = `[${label}] ${args.map((a) => String(a)).join(" ")}`;
+      logs.push(msg);
+      if (typeof console !== "undefined" && console.log) console.log(msg);
+    };
+    return { log, logs };
+  }
+
+  function nodeGlobals(rounds = 2_000) {
+    const { log, logs } = makeLogger("node_globals");
+    try {
+      log(`node globals started (rounds=${rounds})`);
+      const isNode = typeof process !== "undefined" && typeof process.versions === "object";
+      if (!isNode) {
+        log("node globals finished (no Node runtime; skipped)");
+        return { result: { node: false }, logs, verification: { node: false, completed: true } };
+      }
+
+      const start = performance.now();
+      const encoder = new TextEncoder();
+      const decoder = new TextDecoder();
+      const pathJoin = require("path").join;
+      let bytes = 0;
+      let checksum = 0;
+      for (let i = 0; i < rounds; i += 1) {
+        const text = `round-${i}`;
+        const encoded = Buffer.from(text, "utf8").toString("base64");
+        checksum = (checksum + Buffer.from(encoded, "base64").length) % 1_000_003;
+        bytes += encoder.encode(decoder.decode(encoder.encode(text))).length;
+      }
+      const url = new URL("https://example.com/bench/path?round=1");
+      const timers = [setTimeout, setInterval, setImmediate, queueMicrotask].every(
+        (fn) => typeof fn === "function"
+      );
+      // Cleared straight away: only their existence matters, not the callbacks.
+      clearTimeout(setTimeout(() => {}, 0));
+      clearImmediate(setImmediate(() => {}));
+      const durationMs = performance.now() - start;
+      const result = {
+        node: true,
+        bytes,
+        checksum,
+        host: url.hostname,
+        joined: pathJoin("a", "b"),
+        timers,
+        hasProcessEnv: typeof process.env === "object",
+      };
+      log(`node globals finished in ${durationMs.toFixed(2)}ms (bytes=${bytes})`);
+      return {
+        result,
+        logs,
+        verification: {
+          node: true,
+          rounds,
+          bytes,
+          timers,
+          host: url.hostname,
+          completed: timers && url.hostname === "example.com" && bytes > 0,
+        },
+      };
+    } catch (error) {
+      const errorMsg = `node globals error: ${error}`;
+      const stackMsg = error.stack ? ` | stack: ${error.stack}` : "";
+      log(`error: ${errorMsg}${stackMsg}`);
+      if (typeof console !== "undefined" && console.error) {
+        console.error(`[node_globals:error] ${errorMsg}${stackMsg}`);
+      }
+      throw error;
+    }
+  }
+
+  benchRunners.nodeGlobals = (context = {}, rounds) => nodeGlobals(rounds ?? context.rounds);
+
+  const shouldAutoRun = !(
+    typeof module !== "undefined" &&
+    module.parent
+  );
+  if (shouldAutoRun) {
+    try {
+      const result = nodeGlobals();
+      if (typeof module !== "undefined" && module.exports) {
+        module.exports = result;
+      }
+      return result;
+    } catch (error) {
+      const errorMsg = `[node_globals:error] Execution failed: ${error}`;
+      const stackMsg = error.stack ? ` | stack: ${error.stack}` : "";
+      if (typeof console !== "undefined") {
+        console.error(errorMsg + stackMsg);
+      }
+      throw error;
+    }
+  }
+})();
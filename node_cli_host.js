@@ -0,0 +1,102 @@
+// Persistent Node worker for the node-cli benchmark engine.
+// Reads length-prefixed (4-byte big-endian) scripts from stdin and replies with
+// length-prefixed JSON on stdout, so each iteration costs one pipe round trip
+// instead of a full Node startup. Do not feed it untrusted code.
+//
+// Scripts run in this process's main context, as under `node -e`, so Node globals
+// (process, Buffer, timers, performance, URL, TextEncoder, ...) are all available.
+const path = require("path");
+const { createRequire } = require("module");
+const { Script } = require("vm");
+
+const verbose =
+  process.env.VERBOSE === "1" ||
+  process.env.DEBUG === "1" ||
+  process.env.LOG_LEVEL === "debug";
+
+const logError = (...args) => {
+  process.stderr.write(`${args.map((a) => String(a)).join(" ")}\n`);
+};
+
+// stdout carries the protocol, so script output may only go to stderr: keep the real
+// stdout writer for replies and route console and process.stdout writes away from it.
+const writeReply = process.stdout.write.bind(process.stdout);
+const forward = (level) => (...args) => {
+  if (verbose) {
+    process.stderr.write(`[${level}] ${args.map((a) => String(a)).join(" ")}\n`);
+  }
+};
+globalThis.console = {
+  log: forward("log"),
+  info: forward("info"),
+  warn: forward("warn"),
+  error: forward("error"),
+  debug: forward("debug"),
+};
+process.stdout.write = (chunk, encoding, callback) => {
+  if (verbose) {
+    process.stderr.write(chunk, encoding);
+  }
+  const done = typeof encoding === "function" ? encoding : callback;
+  if (typeof done === "function") {
+    process.nextTick(done);
+  }
+  return true;
+};
+
+// Like `node -e`: require resolves from the working directory, not from this file.
+globalThis.require = createRequire(path.join(process.cwd(), "[eval]"));
+globalThis.__filename = "[eval]";
+globalThis.__dirname = ".";
+
+// The same source is sent every iteration; keep its compiled Script around.
+let cachedSource = null;
+let cachedScript = null;
+
+function runSource(source) {
+  try {
+    if (source !== cachedSource) {
+      cachedScript = new Script(source, { filename: "user-code.js" });
+      cachedSource = source;
+    }
+    // Fresh module/exports per run so a script's exports never leak into the next run.
+    globalThis.module = { exports: {} };
+    globalThis.exports = globalThis.module.exports;
+    const result = cachedScript.runInThisContext();
+    return { ok: true, result: result ?? null };
+  } catch (error) {
+    const errorStack = error && error.stack ? ` | stack: ${error.stack}` : "";
+    return { ok: false, error: String(error) + errorStack };
+  }
+}
+
+function reply(message) {
+  const body = Buffer.from(JSON.stringify(message), "utf8");
+  const header = Buffer.alloc(4);
+  header.writeUInt32BE(body.length, 0);
+  writeReply(Buffer.concat([header, body]));
+}
+
+let pending = Buffer.alloc(0);
+
+process.stdin.on("data", (chunk) => {
+  pending = pending.length ? Buffer.concat([pending, chunk]) : chunk;
+  while (pending.length >= 4) {
+    const size = pending.readUInt32BE(0);
+    if (pending.length < 4 + size) {
+      break;
+    }
+    const source = pending.subarray(4, 4 + size).toString("utf8");
+    pending = pending.subarray(4 + size);
+    reply(runSource(source));
+  }
+});
+
+// The harness closes stdin to ask the worker to exit.
+process.stdin.on("end", () => {
+  process.exit(0);
+});
+
+process.on("uncaughtException", (error) => {
+  logError("node-cli host uncaught exception:", error);
+});
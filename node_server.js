@@ -42,14 +42,24 @@ function makeConsoleCollector() {
   };
 }
 
+// Send an explicit Content-Length (instead of chunked encoding) so keep-alive clients can
+// read each reply with a single sized read.
+function sendJson(res, status, value) {
+  const body = JSON.stringify(value);
+  res.writeHead(status, {
+    "Content-Type": "application/json",
+    "Content-Length": Buffer.byteLength(body),
+  });
+  res.end(body);
+}
+
 const server = http.createServer((req, res) => {
   const start = Date.now();
   // Ensure response is always sent, even on unexpected errors
   const sendError = (status, error) => {
     try {
       if (!res.headersSent) {
-        res.writeHead(status, { "Content-Type": "application/json" });
-        res.end(JSON.stringify({ ok: false, error: String(error), logs: [] }));
+        sendJson(res, status, { ok: false, error: String(error), logs: [] });
       }
     } catch (e) {
       logError("Failed to send error response:", e);
@@ -58,15 +68,22 @@ const server = http.createServer((req, res) => {
 
   try {
     if (req.method === "GET" && req.url === "/health") {
-      res.writeHead(200, { "Content-Type": "application/json" });
-      res.end(JSON.stringify({ ok: true }));
+      sendJson(res, 200, { ok: true });
       log("health check ok", { durationMs: Date.now() - start });
       return;
     }
 
+    if (req.method === "POST" && req.url === "/shutdown") {
+      // Cooperative shutdown for the harness: reply first, then exit without waiting
+      // for idle keep-alive sockets to time out.
+      sendJson(res, 200, { ok: true });
+      log("shutdown requested", { durationMs: Date.now() - start });
+      res.on("finish", () => setImmediate(() => process.exit(0)));
+      return;
+    }
+
     if (req.method !== "POST" || req.url !== "/run") {
-      res.writeHead(404, { "Content-Type": "application/json" });
-      res.end(JSON.stringify({ ok: false, error: "Not found" }));
+      sendJson(res, 404, { ok: false, error: "Not found" });
       return;
     }
 
@@ -94,11 +111,18 @@ const server = http.createServer((req, res) => {
         throw new Error(`Invalid JSON: ${err.message}`);
       }
       if (typeof payload.code !== "string") {
-        res.writeHead(400, { "Content-Type": "application/json" });
-        res.end(JSON.stringify({ ok: false, error: "Missing code" }));
+        sendJson(res, 400, { ok: false, error: "Missing code" });
         log("request rejected: missing code", commonMeta);
         return;
       }
+      // Optional batch mode: run `code` once to install `entry`, then call it `iterations`
+      // times and report per-call timings measured inside the VM.
+      const batch = payload.iterations !== undefined;
+      if (batch && !(Number.isInteger(payload.iterations) && payload.iterations > 0)) {
+        sendJson(res, 400, { ok: false, error: "iterations must be a positive integer" });
+        log("request rejected: bad iterations", commonMeta);
+        return;
+      }
 
       const script = new Script(payload.code, { filename: "user-code.js" });
       // Create context with require support for loading peer modules
@@ -171,8 +195,22 @@ const server = http.createServer((req, res) => {
         exports: {},
       });
       let result;
+      let timings;
       try {
         result = script.runInContext(context);
+        if (batch) {
+          const entryName = payload.entry || "__benchRunOnce";
+          const entry = context[entryName];
+          if (typeof entry !== "function") {
+            throw new Error(`Batch entry ${entryName} is not a function`);
+          }
+          timings = [];
+          for (let i = 0; i < payload.iterations; i += 1) {
+            const t0 = performance.now();
+            result = entry();
+            timings.push(performance.now() - t0);
+          }
+        }
       } catch (scriptError) {
         const errorMsg = String(scriptError);
         const errorStack = scriptError.stack ? ` | stack: ${scriptError.stack}` : "";
@@ -181,9 +219,12 @@ const server = http.createServer((req, res) => {
         throw scriptError;
       }
 
-      res.writeHead(200, { "Content-Type": "application/json" });
-      res.end(JSON.stringify({ ok: true, result: result ?? null, logs }));
-      log("request ok", { ...commonMeta, logs: logs.length });
+      const responseBody = { ok: true, result: result ?? null, logs };
+      if (timings) {
+        responseBody.timings = timings;
+      }
+      sendJson(res, 200, responseBody);
+      log("request ok", { ...commonMeta, logs: logs.length, iterations: timings ? timings.length : 1 });
     } catch (error) {
       const errorMsg = String(error);
       const errorStack = error.stack ? ` | stack: ${error.stack}` : "";
@@ -202,10 +243,20 @@ const server = http.createServer((req, res) => {
   }
 });
 
-const stop = () =>
+// The harness holds one keep-alive socket per engine for the whole sweep and may leave it
+// idle for longer than Node's 5s default while other engines run; a server-side close would
+// put a reconnect (TCP handshake) inside the next timed sample.
+server.keepAliveTimeout = 0;
+
+const stop = () => {
   server.close(() => {
     process.exit(0);
   });
+  // With no keep-alive timeout, idle harness sockets would otherwise hold close() open.
+  if (typeof server.closeIdleConnections === "function") {
+    server.closeIdleConnections();
+  }
+};
 
 process.on("SIGINT", stop);
 process.on("SIGTERM", stop);
@@ -6,8 +6,21 @@ from __future__ import annotations
 import argparse
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from types import ModuleType
+from typing import Iterable, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _benchmark_js() -> ModuleType:
+    """Import benchmark_js from the repo root; it needs no third-party packages to import."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    import benchmark_js  # noqa: E402 - the repo root is only importable once added above
+
+    return benchmark_js
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,37 +53,87 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to node_server.js if moved.",
     )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help=(
+            "Run each script in its own benchmark_js.py process instead of in this one "
+            "(slower: a fresh interpreter, engine setup and Node server per script)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Benchmark up to N scripts at once (default: 1; implies --isolate). Script i "
+            "uses port --port+i; output is buffered and printed per script in order. "
+            "Parallel scripts compete for CPU, so keep 1 for comparable timings."
+        ),
+    )
     return parser.parse_args()
 
 
 def expand_script_paths(entries: Iterable[str], repo_root: Path) -> List[Path]:
+    discover_scripts = _benchmark_js().discover_scripts
     scripts: list[Path] = []
     for entry in entries:
         path = Path(entry)
         candidates: list[Path]
         if path.is_dir():
-            candidates = sorted(path.glob("*.js"))
+            # Same rule as benchmark_js's default script list.
+            candidates = discover_scripts(path)
+        elif any(ch in entry for ch in ["*", "?", "["]):
+            # Support glob patterns relative to repo root. pathlib's glob also matches
+            # dotfiles, which directory discovery skips, so drop them here too.
+            candidates = sorted(
+                match for match in repo_root.glob(entry) if not match.name.startswith(".")
+            )
+        elif path.suffix == ".js" and path.exists():
+            # Only explicit paths need an existence check; glob results already exist.
+            candidates = [path]
         else:
-            # Support glob patterns relative to repo root.
-            if any(ch in entry for ch in ["*", "?", "["]):
-                candidates = sorted(repo_root.glob(entry))
-            else:
-                candidates = [path]
+            candidates = []
         for candidate in candidates:
-            if candidate.suffix == ".js" and candidate.exists():
+            if candidate.suffix == ".js":
                 scripts.append(candidate.resolve())
-    # Deduplicate while preserving order.
-    seen = set()
+    # Deduplicate while preserving order. Paths are already resolved, so their str form is a
+    # canonical key and avoids Path's normalizing __eq__/__hash__.
+    seen: set[str] = set()
     unique_scripts = []
     for script in scripts:
-        if script not in seen:
-            seen.add(script)
+        key = str(script)
+        if key not in seen:
+            seen.add(key)
             unique_scripts.append(script)
     return unique_scripts
 
 
+def run_in_process(
+    repo_root: Path, scripts: List[Path], args: argparse.Namespace, server_path: Path
+) -> int:
+    """Benchmark every script in this interpreter through benchmark_js, sharing one server."""
+    benchmark_js = _benchmark_js()
+    bench_args = benchmark_js.parse_args(
+        [
+            "--iterations",
+            str(args.iterations),
+            "--port",
+            str(args.port),
+            "--server-path",
+            str(server_path),
+        ]
+    )
+    benchmark_js.setup_logging(verbose=bench_args.verbose)
+    benchmark_js.calibrate_clock_overhead()
+    exit_code = benchmark_js.run_scripts(scripts, bench_args)
+    if exit_code != 0:
+        print(f"Benchmark run failed with exit code {exit_code}.", file=sys.stderr)
+    return 0
+
+
 def main() -> int:
-    repo_root = Path(__file__).resolve().parent.parent
+    repo_root = REPO_ROOT
     args = parse_args()
 
     python_executable_candidates = [
@@ -90,20 +153,16 @@ def main() -> int:
     if args.scripts:
         script_candidates = expand_script_paths(args.scripts, repo_root)
     else:
-        script_candidates = sorted((repo_root / "examples").glob("*.js"))
+        script_candidates = _benchmark_js().discover_scripts(repo_root / "examples")
 
     if not script_candidates:
         print("No JavaScript scripts found to benchmark.", file=sys.stderr)
         return 1
 
     benchmark_path = repo_root / "benchmark_js.py"
-    for script in script_candidates:
-        try:
-            display_name = script.relative_to(repo_root)
-        except ValueError:
-            display_name = script
-        print(f"\n=== Running benchmarks for {display_name} ===", flush=True)
-        cmd = [
+
+    def build_command(script: Path, port: int) -> List[str]:
+        return [
             python_executable,
             str(benchmark_path),
             "--script",
@@ -111,16 +170,80 @@ def main() -> int:
             "--iterations",
             str(args.iterations),
             "--port",
-            str(args.port),
+            str(port),
             "--server-path",
             str(server_path),
         ]
-        result = subprocess.run(cmd, cwd=repo_root)
-        if result.returncode != 0:
+
+    def display(script: Path) -> Path:
+        try:
+            return script.relative_to(repo_root)
+        except ValueError:
+            return script
+
+    def report_failure(script: Path, returncode: int) -> None:
+        if returncode != 0:
             print(
-                f"Benchmark failed for {display_name} with exit code {result.returncode}.",
+                f"Benchmark failed for {display(script)} with exit code {returncode}.",
                 file=sys.stderr,
             )
+
+    isolate = args.isolate or args.jobs > 1
+    venv_dir = repo_root / ".venv"
+    # Dispatching in-process only makes sense if this interpreter is the one a child would
+    # use; otherwise engines installed only in the repo's .venv would silently go missing.
+    foreign_interpreter = venv_dir.exists() and Path(sys.prefix).resolve() != venv_dir.resolve()
+
+    if not isolate and not foreign_interpreter:
+        return run_in_process(repo_root, script_candidates, args, server_path)
+
+    if isolate and args.jobs <= 1:
+        for script in script_candidates:
+            print(f"\n=== Running benchmarks for {display(script)} ===", flush=True)
+            result = subprocess.run(
+                build_command(script, args.port), cwd=repo_root, stdin=subprocess.DEVNULL
+            )
+            report_failure(script, result.returncode)
+        return 0
+
+    if not isolate:
+        # One child (in the .venv interpreter) for the whole list: it starts the Node server
+        # once and reuses it for every script instead of paying a Node cold start per script.
+        cmd = build_command(script_candidates[0], args.port)
+        for script in script_candidates[1:]:
+            cmd += ["--script", str(script)]
+        names = ", ".join(str(display(script)) for script in script_candidates)
+        print(f"\n=== Running benchmarks for {names} ===", flush=True)
+        result = subprocess.run(cmd, cwd=repo_root, stdin=subprocess.DEVNULL)
+        if result.returncode != 0:
+            print(f"Benchmark run failed with exit code {result.returncode}.", file=sys.stderr)
+        return 0
+
+    def run_captured(index: int, script: Path) -> Tuple[int, bytes]:
+        # Each child starts its own Node server, so give every script its own port.
+        result = subprocess.run(
+            build_command(script, args.port + index),
+            cwd=repo_root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        return result.returncode, result.stdout
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(run_captured, index, script)
+            for index, script in enumerate(script_candidates)
+        ]
+        # Print in script order; each block appears as soon as it and its predecessors finish.
+        for script, future in zip(script_candidates, futures):
+            returncode, output = future.result()
+            banner = f"\n=== Running benchmarks for {display(script)} ===\n".encode("utf-8")
+            # Banner and captured output go out in one write so blocks stay contiguous.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(banner + output)
+            sys.stdout.buffer.flush()
+            report_failure(script, returncode)
     return 0
 
 